@@ -1,15 +1,301 @@
 import os
+import sys
 import json
+import asyncio
+import atexit
+import functools
+import hashlib
+import importlib.util
+import math
 import random
-from openai import OpenAI
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import re
+import string
+import threading
+import time
+import weakref
+from typing import Deque, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
+from collections import OrderedDict, deque
 
-# Initialize OpenAI client
-client = OpenAI(
-    api_key=os.environ.get("OPENAI_API_KEY"),
+# One OpenAI client per event loop: its pooled connections belong to the
+# loop that opened them and cannot be reused from another loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, object]" = weakref.WeakKeyDictionary()
+
+def _get_client():
+    """Return the running loop's OpenAI client, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = _create_client()
+    return client
+
+async def _close_client() -> None:
+    """Close the running loop's OpenAI client and its connection pool, if one was created"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+def _create_client():
+    """Create an OpenAI client; the SDK is only imported when first needed"""
+    import httpx
+    from openai import AsyncOpenAI
+    
+    # One pooled client for all requests; HTTP/2 multiplexes concurrent calls
+    # over a single connection when the optional h2 package is installed
+    http_client = httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    )
+    return AsyncOpenAI(
+        api_key=os.environ.get("OPENAI_API_KEY"),
+        http_client=http_client,
+        # Retries are handled by PromptEngineer._request_with_retries
+        max_retries=0,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+# Plain-text guess analyses (the fallback when the JSON reply is unusable)
+# end with an explicit verdict line
+VERDICT_INSTRUCTIONS = (
+    'End your reply with a final line "VERDICT: CORRECT" if the guess is the '
+    'secret word, otherwise "VERDICT: WRONG".'
 )
+VERDICT_RE = re.compile(r"\bVERDICT:\s*(CORRECT|WRONG)\b", re.IGNORECASE)
+
+# Whole-word phrases that mean the player guessed the word; only consulted
+# when a plain-text reply has no verdict line
+WIN_RE = re.compile(r"\b(?:congratulations|correct|you got it|exactly)\b", re.IGNORECASE)
+
+# Asks the model to return guess feedback and the next hint in one response
+ANALYSIS_JSON_INSTRUCTIONS = (
+    'Respond with a JSON object with three keys: "correct" (true if the guess '
+    'is the secret word, otherwise false), "analysis" (your feedback to the '
+    'player) and "hint_if_wrong" (a hint more specific than any given so far, '
+    'or an empty string if the guess is right). Reason silently and output '
+    'only the JSON object; keep "analysis" under 60 words and "hint_if_wrong" '
+    'under 25 words.'
+)
+
+# Embedding model used for semantic response caching
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Conversation history limits: last N exchanges, capped by a token budget;
+# the most recent evicted turns are summarized into a single system message
+MAX_HISTORY_EXCHANGES = 6
+HISTORY_TOKEN_BUDGET = 2000
+SUMMARY_MAX_TURNS = 8
+
+# Upper bound on response length for each game phase. "analysis" covers the
+# JSON feedback plus the stashed hint, which ANALYSIS_JSON_INSTRUCTIONS limits
+# to roughly 150 tokens; the rest is headroom so the JSON is not cut off.
+PHASE_MAX_TOKENS = {
+    "clue": 120,
+    "analysis": 320,
+    "hint": 80,
+}
+
+# Phases whose responses are not shown incrementally, so get_ai_response
+# defaults them to a single non-streaming request. None currently: the meta
+# prompt is rendered locally and never sent to the API.
+NON_STREAMING_PHASES: frozenset = frozenset()
+
+# API request limits: concurrent calls, per-minute budget, and 429 retries
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_MINUTE = 500
+TOKENS_PER_MINUTE = 30000
+MAX_REQUEST_ATTEMPTS = 6
+MAX_BACKOFF_SECONDS = 60
+
+# Streamed output is written in batches: the first delta is shown right away,
+# then the batch size grows until it reaches the cap
+STREAM_MIN_BATCH_CHARS = 1
+STREAM_MAX_BATCH_CHARS = 50
+STREAM_BATCH_GROWTH = 3
+
+# Static chain-of-thought scaffold, folded into the system prompt
+COT_SCAFFOLD = """
+REASONING PROCESS (when analyzing a guess, think step by step):
+1. First, analyze what the player is trying to guess
+2. Then, consider their current understanding level
+3. Next, determine the appropriate difficulty of the response
+4. Finally, craft a response that guides without giving away the answer
+"""
+
+# Separator line used around banners
+_SEP = "=" * 50
+
+# Prompt engineering techniques banner, shown at game start and end
+_INFO_BANNER = "\n".join([
+    "",
+    "🧠 PROMPT ENGINEERING TECHNIQUES IN USE:",
+    _SEP,
+    "✅ Role-based prompting with Game Master persona",
+    "✅ Few-shot learning with example scenarios",
+    "✅ Chain-of-thought reasoning for complex analysis",
+    "✅ Template-based prompts for consistent formatting",
+    "✅ Meta-prompting for self-reflection",
+    "✅ Dynamic parameter adjustment based on difficulty",
+    "✅ Context-aware conversation building",
+    "✅ Progressive hint generation",
+    "✅ Progressive difficulty scaling",
+    "✅ Temperature control for creativity (0.5-0.9)",
+    "✅ Top-p sampling for response diversity (0.8-0.98)",
+    f"✅ Max tokens optimization (per-phase caps, "
+    f"{min(PHASE_MAX_TOKENS.values())}-{max(PHASE_MAX_TOKENS.values())})",
+    "✅ Frequency and presence penalties",
+    _SEP,
+])
+
+# Static prompt content, built once at import
+_SYSTEM_PROMPTS = {
+    "game_master": """You are an expert word guessing game master with 20+ years of experience in educational games. 
+    Your role is to create engaging, educational, and fun word guessing experiences.
+    
+    PERSONALITY TRAITS:
+    - Enthusiastic and encouraging
+    - Patient with learners
+    - Creative in clue generation
+    - Educational focus
+    
+    EXPERTISE AREAS:
+    - Vocabulary building
+    - Critical thinking development
+    - Pattern recognition
+    - Language learning techniques""",
+    
+    "hint_generator": """You are a specialized hint generation AI with expertise in:
+    - Progressive difficulty scaling
+    - Cognitive load management
+    - Learning psychology
+    - Word association patterns
+    
+    Your role is to provide hints that guide without giving away the answer.""",
+    
+    "game_analyst": """You are a game analytics AI that evaluates:
+    - Player performance patterns
+    - Difficulty progression
+    - Learning outcomes
+    - Engagement metrics
+    
+    Provide insights to improve the gaming experience."""
+}
+
+_FEW_SHOT_EXAMPLES = [
+    {
+        "scenario": "initial_clue",
+        "examples": [
+            {
+                "word": "ELEPHANT",
+                "clue": "I'm a large mammal with a long trunk and big ears. I'm known for my memory and live in Africa and Asia.",
+                "difficulty": "easy"
+            },
+            {
+                "word": "SERENDIPITY",
+                "clue": "I'm a noun that describes the pleasant surprise of finding something valuable when you weren't looking for it.",
+                "difficulty": "hard"
+            }
+        ]
+    },
+    {
+        "scenario": "hint_progression",
+        "examples": [
+            {
+                "word": "PHOTOSYNTHESIS",
+                "hints": [
+                    "I'm a biological process that plants use to make food.",
+                    "I require sunlight, water, and carbon dioxide.",
+                    "I produce glucose and oxygen as byproducts.",
+                    "I happen in the chloroplasts of plant cells."
+                ]
+            }
+        ]
+    },
+    {
+        "scenario": "encouragement",
+        "examples": [
+            {
+                "situation": "wrong_guess",
+                "response": "That's a good try! You're thinking in the right direction. The word I'm thinking of is related to your guess but has a different meaning. Would you like a hint to help narrow it down?"
+            },
+            {
+                "situation": "close_guess",
+                "response": "You're getting warmer! That's very close to the right answer. Think about the specific context I mentioned in my clue."
+            }
+        ]
+    }
+]
+
+_TEMPLATE_PROMPTS = {
+    "game_start": """
+    🎮 WELCOME TO THE ULTIMATE WORD GUESSING CHALLENGE! 🎮
+    
+    GAME RULES:
+    - You have {max_attempts} attempts to guess the word
+    - I'll give you an initial clue
+    - You can ask for hints (up to {max_hints} total)
+    - Each hint will be more specific than the last
+    - Think carefully and use your reasoning skills!
+    
+    DIFFICULTY LEVEL: {difficulty}
+    CATEGORY: {category}
+    
+    Ready to test your vocabulary and reasoning skills? Let's begin!
+    """,
+    
+    "hint_request": """
+    HINT REQUEST ANALYSIS:
+    - Current attempt: {attempts}/{max_attempts}
+    - Previous hints given: {hints_given}
+    - Player's last guess: "{last_guess}"
+    
+    HINT STRATEGY:
+    - Provide a hint that's more specific than the last
+    - Guide toward the answer without revealing it
+    - Consider the player's learning style
+    - Maintain engagement and challenge
+    """,
+    
+    "game_end": """
+    GAME COMPLETION ANALYSIS:
+    - Final attempt: {attempts}/{max_attempts}
+    - Total hints used: {hints_given}
+    - Success: {success}
+    
+    FEEDBACK STRATEGY:
+    - Congratulate on success or encourage for next time
+    - Provide educational insights about the word
+    - Suggest related vocabulary to explore
+    - Maintain positive learning environment
+    """
+}
+
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a str.format template into (literal, field_name) chunks once"""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+def _render_template(chunks: Tuple[Tuple[str, Optional[str]], ...], values: Dict[str, object]) -> str:
+    """Render a compiled template by joining its chunks with the given values"""
+    return "".join(
+        literal if field_name is None else literal + str(values[field_name])
+        for literal, field_name in chunks
+    )
+
+# Pre-parsed templates for the prompts rendered every game/turn
+_GAME_START_TPL = _compile_template(_TEMPLATE_PROMPTS["game_start"])
+_HINT_REQUEST_TPL = _compile_template(_TEMPLATE_PROMPTS["hint_request"])
+
+# Pre-built few-shot messages for the hint progression examples
+_FEW_SHOT_MESSAGES = [
+    {"role": "system", "content": f"EXAMPLE HINT PROGRESSION: {json.dumps(example, indent=2)}"}
+    for example in _FEW_SHOT_EXAMPLES[1]["examples"]
+]
+
+class TruncatedResponseError(Exception):
+    """A structured (JSON) reply hit max_tokens and cannot be parsed"""
 
 class GameMode(Enum):
     EASY = "easy"
@@ -24,7 +310,7 @@ class PromptType(Enum):
     ROLE_BASED = "role_based"
     TEMPLATE = "template"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptConfig:
     """Configuration for prompt engineering parameters"""
     max_tokens: int = 1000
@@ -34,7 +320,7 @@ class PromptConfig:
     presence_penalty: float = 0.0
     stop: Optional[List[str]] = None
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     """Track game state and configuration"""
     attempts: int = 0
@@ -45,98 +331,201 @@ class GameState:
     hints_given: int = 0
     max_hints: int = 3
 
+@functools.cache
+def _get_encoding():
+    """Tokenizer for history budgeting, or None if tiktoken is unavailable"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.encoding_for_model("gpt-4o")
+
+def _count_tokens(text: str) -> int:
+    """Count tokens in text, estimating ~4 characters per token without tiktoken"""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+class ResponseCache:
+    """LRU cache of AI responses with exact and semantic (embedding) lookup
+
+    Exact hits require the same messages and config. Semantic hits match
+    on prompt type, config and the similarity of the user input only;
+    conversation history is ignored, so only use the cache for prompts
+    whose answer does not depend on earlier turns.
+    """
+    
+    def __init__(self, max_entries: int = 128, similarity_threshold: float = 0.92):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Tuple[PromptType, PromptConfig, List[float], str]]" = OrderedDict()
+    
+    @staticmethod
+    def key(messages: List[Dict[str, str]], config: PromptConfig) -> str:
+        """Exact-match key for a full message list and config"""
+        payload = json.dumps([messages, asdict(config)], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def has_candidates(self, prompt_type: PromptType, config: PromptConfig) -> bool:
+        """Whether any entry could satisfy a semantic lookup"""
+        return any(
+            cached_type == prompt_type and cached_config == config
+            for cached_type, cached_config, _, _ in self._entries.values()
+        )
+    
+    def get_exact(self, key: str) -> Optional[str]:
+        """Return the cached response for an identical request, if any"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[3]
+    
+    def get_similar(self, prompt_type: PromptType, config: PromptConfig,
+                    embedding: List[float]) -> Optional[str]:
+        """Return the response of the most similar cached prompt above the threshold"""
+        best_key, best_score = None, self.similarity_threshold
+        for key, (cached_type, cached_config, cached_embedding, _) in self._entries.items():
+            if cached_type != prompt_type or cached_config != config:
+                continue
+            score = _cosine_similarity(embedding, cached_embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][3]
+    
+    def put(self, key: str, prompt_type: PromptType, config: PromptConfig,
+            embedding: List[float], response: str) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        self._entries[key] = (prompt_type, config, embedding, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+class RateLimiter:
+    """Sliding one-minute window over request and token counts
+
+    Waits before a request that would exceed either per-minute limit,
+    so bursts of concurrent calls slow down instead of hitting 429s.
+    """
+    
+    def __init__(self, requests_per_minute: int = REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+    
+    def _expire(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= 60.0:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+    
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request of the given token size fits in the window"""
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+            if (len(self._window) < self.requests_per_minute and
+                    self._window_tokens + tokens <= self.tokens_per_minute):
+                self._window.append((now, tokens))
+                self._window_tokens += tokens
+                return
+            await asyncio.sleep(60.0 - (now - self._window[0][0]))
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity of two equal-length vectors"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+# Menu choices for select_difficulty
+_DIFFICULTY_CHOICES = {
+    "1": GameMode.EASY,
+    "2": GameMode.MEDIUM,
+    "3": GameMode.HARD,
+    "4": GameMode.EXPERT,
+}
+
+# Prompt parameters per difficulty level, keyed by GameMode value
+_DIFFICULTY_CONFIGS: Dict[str, PromptConfig] = {
+    GameMode.EASY.value: PromptConfig(
+        max_tokens=800,
+        temperature=0.5,
+        top_p=0.8,
+        frequency_penalty=0.1
+    ),
+    GameMode.MEDIUM.value: PromptConfig(
+        max_tokens=1000,
+        temperature=0.7,
+        top_p=0.9,
+        frequency_penalty=0.0
+    ),
+    GameMode.HARD.value: PromptConfig(
+        max_tokens=1200,
+        temperature=0.8,
+        top_p=0.95,
+        frequency_penalty=-0.1
+    ),
+    GameMode.EXPERT.value: PromptConfig(
+        max_tokens=1500,
+        temperature=0.9,
+        top_p=0.98,
+        frequency_penalty=-0.2
+    )
+}
+
 class PromptEngineer:
     """Advanced prompt engineering class with multiple techniques"""
     
     def __init__(self):
         self.config = PromptConfig()
         self.game_state = GameState()
-        self.conversation_history = []
+        # The opening clue exchange (the only record of the secret word) is
+        # pinned via pin_opening; other exchanges live in the bounded history
+        self._pinned_history: List[Dict[str, str]] = []
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=2 * MAX_HISTORY_EXCHANGES)
+        self._history_tokens = 0
+        self._evicted_turns: Deque[str] = deque(maxlen=SUMMARY_MAX_TURNS)
+        self._summary_messages: List[Dict[str, str]] = []
+        self._base_messages = self._build_base_messages()
+        self.response_cache = ResponseCache()
+        self._stdout_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.rate_limiter = RateLimiter()
+        
+    def _build_base_messages(self) -> List[Dict[str, str]]:
+        """Build the static system prompt shared by every request, once.
+
+        At roughly 270 tokens it is below the API's 1024-token minimum for
+        automatic prompt caching, so the gain is only not rebuilding it.
+        """
+        system_prompt = self.get_system_prompts()["game_master"]
+        return [{"role": "system", "content": f"{system_prompt}\n{COT_SCAFFOLD}"}]
         
+    @functools.cached_property
+    def _base_tokens(self) -> int:
+        """Token count of the static prefix, computed on the first request"""
+        return sum(_count_tokens(m["content"]) for m in self._base_messages)
+    
     def get_system_prompts(self) -> Dict[str, str]:
         """Role-based system prompts for different scenarios"""
-        return {
-            "game_master": """You are an expert word guessing game master with 20+ years of experience in educational games. 
-            Your role is to create engaging, educational, and fun word guessing experiences.
-            
-            PERSONALITY TRAITS:
-            - Enthusiastic and encouraging
-            - Patient with learners
-            - Creative in clue generation
-            - Educational focus
-            
-            EXPERTISE AREAS:
-            - Vocabulary building
-            - Critical thinking development
-            - Pattern recognition
-            - Language learning techniques""",
-            
-            "hint_generator": """You are a specialized hint generation AI with expertise in:
-            - Progressive difficulty scaling
-            - Cognitive load management
-            - Learning psychology
-            - Word association patterns
-            
-            Your role is to provide hints that guide without giving away the answer.""",
-            
-            "game_analyst": """You are a game analytics AI that evaluates:
-            - Player performance patterns
-            - Difficulty progression
-            - Learning outcomes
-            - Engagement metrics
-            
-            Provide insights to improve the gaming experience."""
-        }
+        return _SYSTEM_PROMPTS
     
     def get_few_shot_examples(self) -> List[Dict[str, str]]:
         """Few-shot learning examples for different game scenarios"""
-        return [
-            {
-                "scenario": "initial_clue",
-                "examples": [
-                    {
-                        "word": "ELEPHANT",
-                        "clue": "I'm a large mammal with a long trunk and big ears. I'm known for my memory and live in Africa and Asia.",
-                        "difficulty": "easy"
-                    },
-                    {
-                        "word": "SERENDIPITY",
-                        "clue": "I'm a noun that describes the pleasant surprise of finding something valuable when you weren't looking for it.",
-                        "difficulty": "hard"
-                    }
-                ]
-            },
-            {
-                "scenario": "hint_progression",
-                "examples": [
-                    {
-                        "word": "PHOTOSYNTHESIS",
-                        "hints": [
-                            "I'm a biological process that plants use to make food.",
-                            "I require sunlight, water, and carbon dioxide.",
-                            "I produce glucose and oxygen as byproducts.",
-                            "I happen in the chloroplasts of plant cells."
-                        ]
-                    }
-                ]
-            },
-            {
-                "scenario": "encouragement",
-                "examples": [
-                    {
-                        "situation": "wrong_guess",
-                        "response": "That's a good try! You're thinking in the right direction. The word I'm thinking of is related to your guess but has a different meaning. Would you like a hint to help narrow it down?"
-                    },
-                    {
-                        "situation": "close_guess",
-                        "response": "You're getting warmer! That's very close to the right answer. Think about the specific context I mentioned in my clue."
-                    }
-                ]
-            }
-        ]
+        return _FEW_SHOT_EXAMPLES
     
     def create_chain_of_thought_prompt(self, context: str) -> str:
-        """Create chain-of-thought reasoning prompts"""
+        """Create chain-of-thought reasoning prompts
+
+        Not used when building requests, which carry the static COT_SCAFFOLD
+        in the system prompt instead; kept for callers that want the full text.
+        """
         return f"""
         Let's think step by step about this word guessing scenario:
         
@@ -159,92 +548,163 @@ class PromptEngineer:
     
     def create_template_prompts(self) -> Dict[str, str]:
         """Template-based prompts for different game phases"""
-        return {
-            "game_start": """
-            🎮 WELCOME TO THE ULTIMATE WORD GUESSING CHALLENGE! 🎮
-            
-            GAME RULES:
-            - You have {max_attempts} attempts to guess the word
-            - I'll give you an initial clue
-            - You can ask for hints (up to {max_hints} total)
-            - Each hint will be more specific than the last
-            - Think carefully and use your reasoning skills!
-            
-            DIFFICULTY LEVEL: {difficulty}
-            CATEGORY: {category}
-            
-            Ready to test your vocabulary and reasoning skills? Let's begin!
-            """,
-            
-            "hint_request": """
-            HINT REQUEST ANALYSIS:
-            - Current attempt: {attempts}/{max_attempts}
-            - Previous hints given: {hints_given}
-            - Player's last guess: "{last_guess}"
-            
-            HINT STRATEGY:
-            - Provide a hint that's more specific than the last
-            - Guide toward the answer without revealing it
-            - Consider the player's learning style
-            - Maintain engagement and challenge
-            """,
-            
-            "game_end": """
-            GAME COMPLETION ANALYSIS:
-            - Final attempt: {attempts}/{max_attempts}
-            - Total hints used: {hints_given}
-            - Success: {success}
-            
-            FEEDBACK STRATEGY:
-            - Congratulate on success or encourage for next time
-            - Provide educational insights about the word
-            - Suggest related vocabulary to explore
-            - Maintain positive learning environment
-            """
-        }
+        return _TEMPLATE_PROMPTS
     
     def build_conversation_context(self, user_input: str, prompt_type: PromptType) -> List[Dict[str, str]]:
         """Build comprehensive conversation context with prompt engineering"""
-        messages = []
-        
-        # Add role-based system prompt
-        system_prompt = self.get_system_prompts()["game_master"]
-        messages.append({"role": "system", "content": system_prompt})
-        
-        # Add few-shot examples based on context
-        if "hint" in user_input.lower() or self.game_state.hints_given > 0:
-            few_shot_examples = self.get_few_shot_examples()[1]  # hint_progression
-            for example in few_shot_examples["examples"]:
-                messages.append({
-                    "role": "system", 
-                    "content": f"EXAMPLE HINT PROGRESSION: {json.dumps(example, indent=2)}"
-                })
-        
-        # Add chain-of-thought reasoning
+        # Per-turn game state goes in the user turn so the shared prefix stays static
+        content = user_input
         if prompt_type == PromptType.CHAIN_OF_THOUGHT:
-            cot_prompt = self.create_chain_of_thought_prompt(user_input)
-            messages.append({"role": "system", "content": cot_prompt})
+            content = (
+                f"{user_input}\n\n"
+                f"(Attempt {self.game_state.attempts}/{self.game_state.max_attempts}, "
+                f"hints given: {self.game_state.hints_given})"
+            )
         
-        # Add conversation history
-        messages.extend(self.conversation_history)
+        # Few-shot hint examples go after the shared prefix, for few-shot prompts
+        few_shot = _FEW_SHOT_MESSAGES if prompt_type == PromptType.FEW_SHOT else []
         
-        # Add current user input
-        messages.append({"role": "user", "content": user_input})
+        return (self._base_messages + self._pinned_history + self._summary_messages
+                + list(self.conversation_history) + few_shot + [{"role": "user", "content": content}])
+    
+    def pin_opening(self, user_input: str, ai_response: str) -> None:
+        """Keep the opening clue exchange in every request; it is never evicted"""
+        self._pinned_history = [
+            {"role": "user", "content": user_input},
+            {"role": "assistant", "content": ai_response},
+        ]
+    
+    def remember(self, user_input: str, ai_response: str) -> None:
+        """Add an exchange to history, evicting old ones to stay within budget"""
+        new_tokens = _count_tokens(user_input) + _count_tokens(ai_response)
+        while self.conversation_history and (
+            len(self.conversation_history) >= 2 * MAX_HISTORY_EXCHANGES
+            or self._history_tokens + new_tokens > HISTORY_TOKEN_BUDGET
+        ):
+            self._evict_oldest_exchange()
         
-        return messages
+        self.conversation_history.append({"role": "user", "content": user_input})
+        self.conversation_history.append({"role": "assistant", "content": ai_response})
+        self._history_tokens += new_tokens
     
-    def get_ai_response(self, user_input: str, prompt_type: PromptType = PromptType.ROLE_BASED, 
-                       stream: bool = True, custom_config: Optional[PromptConfig] = None) -> str:
+    def _evict_oldest_exchange(self) -> None:
+        """Drop the oldest user/assistant pair and fold it into the summary"""
+        user_msg = self.conversation_history.popleft()
+        assistant_msg = self.conversation_history.popleft()
+        self._history_tokens -= _count_tokens(user_msg["content"]) + _count_tokens(assistant_msg["content"])
+        self._evicted_turns.append(
+            f"player: {user_msg['content'][:80]!r} / you: {assistant_msg['content'][:80]!r}"
+        )
+        self._summary_messages = [{
+            "role": "system",
+            "content": "Earlier: " + "; ".join(self._evicted_turns),
+        }]
+    
+    async def get_ai_response(self, user_input: str, prompt_type: PromptType = PromptType.ROLE_BASED, 
+                             stream: Optional[bool] = None, custom_config: Optional[PromptConfig] = None,
+                             use_cache: bool = False, remember: bool = True,
+                             response_format: Optional[Dict[str, str]] = None,
+                             phase: Optional[str] = None, pin: bool = False) -> str:
         """Get AI response with advanced prompt engineering"""
         
+        # Stream only what the player watches; background phases use one-shot calls
+        if stream is None:
+            stream = phase not in NON_STREAMING_PHASES
+        
         # Use custom config or default
         config = custom_config or self.config
         
+        # Tighten max_tokens to what this game phase needs; the difficulty
+        # setting remains the ceiling
+        if phase is not None:
+            config = replace(config, max_tokens=min(config.max_tokens, PHASE_MAX_TOKENS[phase]))
+        
         # Build conversation context
         messages = self.build_conversation_context(user_input, prompt_type)
         
+        # Look up exact, then near-duplicate, prompts before calling the model
+        ai_response = None
+        embedding = None
+        if use_cache:
+            cache_key = ResponseCache.key(messages, config)
+            ai_response = self.response_cache.get_exact(cache_key)
+            # Only wait on an embedding first if something could match it
+            if ai_response is None and self.response_cache.has_candidates(prompt_type, config):
+                embedding = await self._embed(user_input)
+                ai_response = self.response_cache.get_similar(prompt_type, config, embedding)
+            if ai_response is not None and stream:
+                async with self._stdout_lock:
+                    print(f"\n🤖 AI: {ai_response}", flush=True)
+        
+        if ai_response is None:
+            if use_cache and embedding is None:
+                # Embed alongside the completion; the embedding is only needed to store it
+                embedding, ai_response = await asyncio.gather(
+                    self._embed(user_input),
+                    self._create_completion(messages, config, stream, response_format),
+                )
+            else:
+                ai_response = await self._create_completion(messages, config, stream, response_format)
+            if use_cache:
+                self.response_cache.put(cache_key, prompt_type, config, embedding, ai_response)
+        
+        # Update conversation history
+        if pin:
+            self.pin_opening(user_input, ai_response)
+        elif remember:
+            self.remember(user_input, ai_response)
+        
+        return ai_response
+    
+    async def _embed(self, text: str) -> List[float]:
+        """Embed text for semantic cache lookups"""
+        async def request():
+            return await _get_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+        
+        response = await self._request_with_retries(request, _count_tokens(text))
+        return response.data[0].embedding
+    
+    async def _request_with_retries(self, request, estimated_tokens: int):
+        """Run an API request within the rate budget, backing off on 429s
+
+        Each attempt holds a concurrency slot only while it runs; backoff
+        sleeps happen outside the semaphore.
+        """
+        from openai import RateLimitError
+        
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            await self.rate_limiter.acquire(estimated_tokens)
+            try:
+                async with self._request_semaphore:
+                    return await request()
+            except RateLimitError:
+                if attempt == MAX_REQUEST_ATTEMPTS - 1:
+                    raise
+            # Random exponential backoff between 1s and the cap
+            delay = random.uniform(1, min(MAX_BACKOFF_SECONDS, 2 ** (attempt + 1)))
+            await asyncio.sleep(delay)
+    
+    async def _create_completion(self, messages: List[Dict[str, str]], config: PromptConfig,
+                                 stream: bool, response_format: Optional[Dict[str, str]] = None) -> str:
+        """Send a chat completion request, streaming it to stdout if requested"""
+        # The static prefix is counted once, on first use
+        estimated_tokens = (
+            self._base_tokens
+            + sum(_count_tokens(m["content"]) for m in messages[len(self._base_messages):])
+            + config.max_tokens
+        )
+        return await self._request_with_retries(
+            lambda: self._send_completion(messages, config, stream, response_format),
+            estimated_tokens,
+        )
+    
+    async def _send_completion(self, messages: List[Dict[str, str]], config: PromptConfig,
+                               stream: bool, response_format: Optional[Dict[str, str]]) -> str:
+        """Issue the completion request and collect the response text"""
+        extra_params = {"response_format": response_format} if response_format else {}
+        
         # Create completion with all parameters
-        response = client.chat.completions.create(
+        response = await _get_client().chat.completions.create(
             model="gpt-4o",
             messages=messages,
             max_tokens=config.max_tokens,
@@ -254,55 +714,44 @@ class PromptEngineer:
             presence_penalty=config.presence_penalty,
             stop=config.stop,
             stream=stream,
+            **extra_params,
         )
         
-        if stream:
-            ai_response = ""
+        # Non-interactive calls take the one-shot result without touching stdout
+        if not stream:
+            choice = response.choices[0]
+            if response_format and choice.finish_reason == "length":
+                raise TruncatedResponseError("structured reply was cut off at max_tokens")
+            return choice.message.content
+        
+        # Only one response streams to the terminal at a time; concurrent
+        # streamed calls still send their requests in parallel
+        async with self._stdout_lock:
+            parts = []
+            buf = []
+            buf_chars = 0
+            next_flush = STREAM_MIN_BATCH_CHARS
             print("\n🤖 AI: ", end='', flush=True)
-            for chunk in response:
+            async for chunk in response:
                 if chunk.choices[0].delta.content is not None:
                     content = chunk.choices[0].delta.content
-                    print(content, end='', flush=True)
-                    ai_response += content
-            print()  # New line after streaming
-        else:
-            ai_response = response.choices[0].message.content
-        
-        # Update conversation history
-        self.conversation_history.append({"role": "user", "content": user_input})
-        self.conversation_history.append({"role": "assistant", "content": ai_response})
-        
-        return ai_response
+                    parts.append(content)
+                    buf.append(content)
+                    buf_chars += len(content)
+                    # Write in batches that grow as the stream warms up
+                    if buf_chars >= next_flush:
+                        sys.stdout.write("".join(buf))
+                        sys.stdout.flush()
+                        buf.clear()
+                        buf_chars = 0
+                        next_flush = min(STREAM_MAX_BATCH_CHARS, next_flush * STREAM_BATCH_GROWTH)
+            sys.stdout.write("".join(buf))
+            print(flush=True)  # New line after streaming
+        return "".join(parts)
     
     def adjust_parameters_for_difficulty(self, difficulty: GameMode) -> PromptConfig:
         """Adjust prompt parameters based on game difficulty"""
-        configs = {
-            GameMode.EASY: PromptConfig(
-                max_tokens=800,
-                temperature=0.5,
-                top_p=0.8,
-                frequency_penalty=0.1
-            ),
-            GameMode.MEDIUM: PromptConfig(
-                max_tokens=1000,
-                temperature=0.7,
-                top_p=0.9,
-                frequency_penalty=0.0
-            ),
-            GameMode.HARD: PromptConfig(
-                max_tokens=1200,
-                temperature=0.8,
-                top_p=0.95,
-                frequency_penalty=-0.1
-            ),
-            GameMode.EXPERT: PromptConfig(
-                max_tokens=1500,
-                temperature=0.9,
-                top_p=0.98,
-                frequency_penalty=-0.2
-            )
-        }
-        return configs.get(difficulty, self.config)
+        return _DIFFICULTY_CONFIGS.get(difficulty.value, self.config)
     
     def create_meta_prompt(self, task: str) -> str:
         """Create meta-prompting for self-reflection and improvement"""
@@ -326,7 +775,7 @@ class PromptEngineer:
         - Implement role-based prompting for personality
         
         CURRENT CONFIGURATION:
-        - Max tokens: {self.config.max_tokens}
+        - Max tokens ceiling (per-phase caps apply): {self.config.max_tokens}
         - Temperature: {self.config.temperature}
         - Top-p: {self.config.top_p}
         - Game mode: {self.game_state.game_mode.value}
@@ -335,75 +784,114 @@ class PromptEngineer:
 # Initialize the prompt engineer
 prompt_engineer = PromptEngineer()
 
+# Background event loop and PromptEngineer for legacy synchronous calls.
+# The shim never touches prompt_engineer, whose locks, rate limiter and
+# history belong to the game's loop; everything here runs on one thread.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_engineer: Optional[PromptEngineer] = None
+_sync_lock = threading.Lock()
+
+def _get_sync_runtime() -> Tuple[asyncio.AbstractEventLoop, PromptEngineer]:
+    """Start the shim's loop thread and PromptEngineer on first use"""
+    global _sync_loop, _sync_engineer
+    with _sync_lock:
+        if _sync_loop is None:
+            _sync_engineer = PromptEngineer()
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="sync-ai-loop", daemon=True).start()
+            atexit.register(_shutdown_sync_runtime)
+    return _sync_loop, _sync_engineer
+
+def _shutdown_sync_runtime() -> None:
+    """Close the shim's client and stop its loop at interpreter exit"""
+    asyncio.run_coroutine_threadsafe(_close_client(), _sync_loop).result(timeout=5)
+    _sync_loop.call_soon_threadsafe(_sync_loop.stop)
+
 def get_ai_response(messages, stream=True):
-    """Legacy function for backward compatibility"""
-    return prompt_engineer.get_ai_response(messages[-1]["content"], stream=stream)
+    """Legacy function for backward compatibility
+
+    Runs on a persistent background loop with its own PromptEngineer and
+    conversation history, separate from the game's. Calls from code already
+    inside an event loop block that loop until the reply arrives.
+    """
+    loop, engineer = _get_sync_runtime()
+    coro = engineer.get_ai_response(messages[-1]["content"], stream=stream)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
 def display_prompt_engineering_info():
     """Display information about prompt engineering techniques being used"""
-    print("\n🧠 PROMPT ENGINEERING TECHNIQUES IN USE:")
-    print("=" * 50)
-    print("✅ Role-based prompting (Game Master persona)")
-    print("✅ Few-shot learning examples")
-    print("✅ Chain-of-thought reasoning")
-    print("✅ Template-based prompts")
-    print("✅ Meta-prompting for self-reflection")
-    print("✅ Dynamic parameter adjustment")
-    print("✅ Context-aware conversation building")
-    print("✅ Progressive difficulty scaling")
-    print("=" * 50)
+    sys.stdout.write(_INFO_BANNER)
+    sys.stdout.write("\n")
 
 def select_difficulty():
     """Let user select game difficulty"""
     print("\n🎯 SELECT DIFFICULTY LEVEL:")
-    print("1. Easy (Temperature: 0.5, Max Tokens: 800)")
-    print("2. Medium (Temperature: 0.7, Max Tokens: 1000)")
-    print("3. Hard (Temperature: 0.8, Max Tokens: 1200)")
-    print("4. Expert (Temperature: 0.9, Max Tokens: 1500)")
+    print("1. Easy (Temperature: 0.5, Top-p: 0.8)")
+    print("2. Medium (Temperature: 0.7, Top-p: 0.9)")
+    print("3. Hard (Temperature: 0.8, Top-p: 0.95)")
+    print("4. Expert (Temperature: 0.9, Top-p: 0.98)")
     
     while True:
         choice = input("\nEnter your choice (1-4): ").strip()
-        if choice == "1":
-            return GameMode.EASY
-        elif choice == "2":
-            return GameMode.MEDIUM
-        elif choice == "3":
-            return GameMode.HARD
-        elif choice == "4":
-            return GameMode.EXPERT
-        else:
-            print("Please enter a valid choice (1-4)")
+        difficulty = _DIFFICULTY_CHOICES.get(choice)
+        if difficulty is not None:
+            return difficulty
+        print("Please enter a valid choice (1-4)")
+
+def parse_guess_analysis(raw_response: str) -> Optional[Tuple[str, str, bool]]:
+    """Split a JSON guess analysis into (analysis, hint_if_wrong, correct)
+
+    Returns None if the response is not the expected JSON object.
+    """
+    try:
+        payload = json.loads(raw_response)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or not payload.get("analysis"):
+        return None
+    analysis = str(payload["analysis"])
+    hint = str(payload.get("hint_if_wrong") or "")
+    return analysis, hint, payload.get("correct") is True
+
+def parse_plain_verdict(reply: str) -> bool:
+    """Whether a plain-text guess analysis says the guess was correct
 
-def demonstrate_prompt_techniques():
+    Uses the last VERDICT line if present, else whole-word WIN_RE phrases.
+    """
+    verdicts = VERDICT_RE.findall(reply)
+    if verdicts:
+        return verdicts[-1].upper() == "CORRECT"
+    return bool(WIN_RE.search(reply))
+
+async def demonstrate_prompt_techniques():
     """Demonstrate different prompt engineering techniques"""
     print("\n🔬 PROMPT ENGINEERING DEMONSTRATION:")
-    print("=" * 50)
+    print(_SEP)
     
-    # Demonstrate chain-of-thought prompting
-    print("\n1. CHAIN-OF-THOUGHT PROMPTING:")
-    cot_response = prompt_engineer.get_ai_response(
-        "I'm thinking of a word that starts with 'S' and is related to science",
-        PromptType.CHAIN_OF_THOUGHT,
-        stream=False
-    )
+    async def _one(prompt: str, prompt_type: PromptType) -> str:
+        # Independent prompts finish in any order, so keep them out of history
+        return await prompt_engineer.get_ai_response(prompt, prompt_type, stream=False,
+                                                     use_cache=True, remember=False)
     
-    # Demonstrate few-shot learning
-    print("\n2. FEW-SHOT LEARNING:")
-    few_shot_response = prompt_engineer.get_ai_response(
-        "Give me a clue for a word related to space",
-        PromptType.FEW_SHOT,
-        stream=False
+    # The three prompts are independent, so issue them as one concurrent batch
+    cot_response, few_shot_response, role_response = await asyncio.gather(
+        # Chain-of-thought prompting
+        _one("I'm thinking of a word that starts with 'S' and is related to science",
+             PromptType.CHAIN_OF_THOUGHT),
+        # Few-shot learning
+        _one("Give me a clue for a word related to space", PromptType.FEW_SHOT),
+        # Role-based prompting
+        _one("What makes a good word guessing game?", PromptType.ROLE_BASED),
     )
     
-    # Demonstrate role-based prompting
+    print("\n1. CHAIN-OF-THOUGHT PROMPTING:")
+    print(cot_response)
+    print("\n2. FEW-SHOT LEARNING:")
+    print(few_shot_response)
     print("\n3. ROLE-BASED PROMPTING:")
-    role_response = prompt_engineer.get_ai_response(
-        "What makes a good word guessing game?",
-        PromptType.ROLE_BASED,
-        stream=False
-    )
+    print(role_response)
 
-def main_game_loop():
+async def main_game_loop():
     """Main game loop with advanced prompt engineering"""
     # Display prompt engineering info
     display_prompt_engineering_info()
@@ -417,27 +905,32 @@ def main_game_loop():
     prompt_engineer.config = config
     
     print(f"\n🎮 Starting {difficulty.value.upper()} mode game!")
-    print(f"📊 Configuration: Max Tokens={config.max_tokens}, Temperature={config.temperature}, Top-p={config.top_p}")
+    phase_caps = ", ".join(
+        f"{phase} {min(config.max_tokens, cap)}" for phase, cap in PHASE_MAX_TOKENS.items()
+    )
+    print(f"📊 Configuration: Temperature={config.temperature}, Top-p={config.top_p}, "
+          f"Max Tokens per phase: {phase_caps}")
     
     # Get initial clue using template prompting
-    template_prompts = prompt_engineer.create_template_prompts()
-    game_start_prompt = template_prompts["game_start"].format(
-        max_attempts=prompt_engineer.game_state.max_attempts,
-        max_hints=prompt_engineer.game_state.max_hints,
-        difficulty=difficulty.value.upper(),
-        category="General Knowledge"
-    )
+    game_start_prompt = _render_template(_GAME_START_TPL, {
+        "max_attempts": prompt_engineer.game_state.max_attempts,
+        "max_hints": prompt_engineer.game_state.max_hints,
+        "difficulty": difficulty.value.upper(),
+        "category": "General Knowledge",
+    })
     
-    print("\n" + "=" * 50)
+    print("\n" + _SEP)
     print(game_start_prompt)
-    print("=" * 50)
+    print(_SEP)
     
     # Get initial clue from AI with role-based prompting
     initial_prompt = "Let's play a word guessing game! Give me a word to guess with an initial clue."
-    ai_response = prompt_engineer.get_ai_response(
+    ai_response = await prompt_engineer.get_ai_response(
         initial_prompt, 
         PromptType.ROLE_BASED,
-        custom_config=config
+        custom_config=config,
+        phase="clue",
+        pin=True
     )
     
     # Game loop with advanced prompt engineering
@@ -455,16 +948,44 @@ def main_game_loop():
             prompt_engineer.game_state.attempts -= 1
             continue
         
-        # Use chain-of-thought for analyzing the guess
-        guess_analysis = f"Player guessed: '{user_guess}'. Analyze this guess and provide feedback."
-        ai_response = prompt_engineer.get_ai_response(
-            guess_analysis,
-            PromptType.CHAIN_OF_THOUGHT,
-            custom_config=config
-        )
+        # Use chain-of-thought for analyzing the guess; the same request also
+        # drafts the next hint so asking for one costs no extra round trip
+        guess_feedback = f"Player guessed: '{user_guess}'. Analyze this guess and provide feedback."
+        guess_analysis = f"{guess_feedback} {ANALYSIS_JSON_INSTRUCTIONS}"
+        try:
+            raw_analysis = await prompt_engineer.get_ai_response(
+                guess_analysis,
+                PromptType.CHAIN_OF_THOUGHT,
+                stream=False,
+                custom_config=config,
+                remember=False,
+                response_format={"type": "json_object"},
+                phase="analysis"
+            )
+            parsed_analysis = parse_guess_analysis(raw_analysis)
+        except TruncatedResponseError:
+            parsed_analysis = None
+        
+        if parsed_analysis is not None:
+            ai_response, stashed_hint, correct = parsed_analysis
+            print(f"\n🤖 AI: {ai_response}")
+            # Keep the JSON instructions out of history; they are resent every turn
+            prompt_engineer.remember(guess_feedback, ai_response)
+        else:
+            # The structured reply was cut off or malformed; ask again in plain text
+            ai_response = await prompt_engineer.get_ai_response(
+                f"{guess_feedback} {VERDICT_INSTRUCTIONS}",
+                PromptType.CHAIN_OF_THOUGHT,
+                custom_config=config,
+                remember=False,
+                phase="analysis"
+            )
+            prompt_engineer.remember(guess_feedback, ai_response)
+            stashed_hint = ""
+            correct = parse_plain_verdict(ai_response)
         
         # Check if game should continue
-        if any(word in ai_response.lower() for word in ["congratulations", "correct", "you got it", "right", "exactly"]):
+        if correct:
             prompt_engineer.game_state.game_over = True
             print("\n🎉 Game Complete! Thanks for playing! 🎉")
             
@@ -483,19 +1004,25 @@ def main_game_loop():
                 prompt_engineer.game_state.hints_given += 1
                 
                 # Use template prompting for hint request
-                hint_template = prompt_engineer.create_template_prompts()["hint_request"].format(
-                    attempts=prompt_engineer.game_state.attempts,
-                    max_attempts=prompt_engineer.game_state.max_attempts,
-                    hints_given=prompt_engineer.game_state.hints_given,
-                    last_guess=user_guess
-                )
-                
+                hint_template = _render_template(_HINT_REQUEST_TPL, {
+                    "attempts": prompt_engineer.game_state.attempts,
+                    "max_attempts": prompt_engineer.game_state.max_attempts,
+                    "hints_given": prompt_engineer.game_state.hints_given,
+                    "last_guess": user_guess,
+                })
                 hint_request = f"{hint_template}\n\nProvide a helpful hint for the word."
-                hint_response = prompt_engineer.get_ai_response(
-                    hint_request,
-                    PromptType.FEW_SHOT,
-                    custom_config=config
-                )
+                
+                if stashed_hint:
+                    print(f"\n🤖 AI: {stashed_hint}")
+                    prompt_engineer.remember(hint_request, stashed_hint)
+                else:
+                    # The analysis did not include a usable hint; ask for one
+                    hint_response = await prompt_engineer.get_ai_response(
+                        hint_request,
+                        PromptType.FEW_SHOT,
+                        custom_config=config,
+                        phase="hint"
+                    )
     
     # Game over message if max attempts reached
     if (prompt_engineer.game_state.attempts >= prompt_engineer.game_state.max_attempts and 
@@ -507,23 +1034,15 @@ def main_game_loop():
         final_analysis = prompt_engineer.create_meta_prompt("Game over analysis")
         print(f"\n🧠 {final_analysis}")
     
-    print("\n" + "=" * 50)
-    print("🎓 PROMPT ENGINEERING TECHNIQUES USED IN THIS SESSION:")
-    print("=" * 50)
-    print("✅ Role-based prompting with Game Master persona")
-    print("✅ Few-shot learning with example scenarios")
-    print("✅ Chain-of-thought reasoning for complex analysis")
-    print("✅ Template-based prompts for consistent formatting")
-    print("✅ Meta-prompting for self-reflection")
-    print("✅ Dynamic parameter adjustment based on difficulty")
-    print("✅ Context-aware conversation building")
-    print("✅ Progressive hint generation")
-    print("✅ Temperature control for creativity (0.5-0.9)")
-    print("✅ Top-p sampling for response diversity (0.8-0.98)")
-    print("✅ Max tokens optimization (800-1500)")
-    print("✅ Frequency and presence penalties")
-    print("=" * 50)
+    display_prompt_engineering_info()
+
+async def main():
+    """Async entry point for the game"""
+    try:
+        await main_game_loop()
+    finally:
+        await _close_client()
 
 # Start the enhanced game
 if __name__ == "__main__":
-    main_game_loop()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file